@@ -37,10 +37,31 @@ OUT_DIR = REPO_ROOT / "data" / "processed" / "baselines"
 COLUMNS = ["origin", "hour", "y_true", "y_pred", "model"]
 
 
+def _ends_mid_row(out_path: Path) -> bool:
+    """True if the last row was cut off before its newline was written.
+
+    pd.read_csv still parses such a row -- e.g. hour 23 with y_pred truncated
+    to "1." -- so a crash mid-write would otherwise complete its origin with
+    a corrupt value, and the next append would be glued onto the same line.
+    """
+    with open(out_path, "rb") as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, 2)
+        return f.read(1) != b"\n"
+
+
+def _read_written_rows(out_path: Path, **kwargs) -> pd.DataFrame:
+    """Rows of a results CSV, excluding a final row torn mid-write."""
+    df = pd.read_csv(out_path, **kwargs)
+    return df.iloc[:-1] if _ends_mid_row(out_path) else df
+
+
 def completed_origins(out_path: Path) -> set[pd.Timestamp]:
     if not out_path.exists():
         return set()
-    done = pd.read_csv(out_path, usecols=["origin", "hour"])
+    done = _read_written_rows(out_path, usecols=["origin", "hour"])
     # only trust origins with all 24 hours written (guards against a row
     # written mid-crash)
     counts = done.groupby("origin").size()
@@ -56,21 +77,23 @@ def repair_partial_origins(out_path: Path) -> int:
     consumer then breaks or lies: daily_baseload raises, pivot() raises on
     the duplicate (origin, hour) entries, and the monitor's row count
     reports inflated progress. Repairing on resume keeps the file
-    self-consistent without hand-editing frozen outputs.
+    self-consistent without hand-editing frozen outputs. A final row with
+    no trailing newline counts as torn, so it is dropped here too.
 
     Returns the number of rows removed. No-op when the file is absent.
     """
     if not out_path.exists():
         return 0
-    df = pd.read_csv(out_path)
-    if df.empty:
+    torn_row = _ends_mid_row(out_path)
+    df = _read_written_rows(out_path)
+    if df.empty and not torn_row:
         return 0
     counts = df.groupby("origin")["hour"].size()
     complete = set(counts[counts == 24].index)
-    if len(complete) == len(counts):
+    if len(complete) == len(counts) and not torn_row:
         return 0
     kept = df[df["origin"].isin(complete)]
-    removed = len(df) - len(kept)
+    removed = len(df) - len(kept) + torn_row
     kept.to_csv(out_path, index=False)
     print(
         f"repaired {out_path.name}: dropped {removed} row(s) from "
@@ -150,13 +150,49 @@ def fit_frozen() -> None:
 # --------------------------------------------------------------------------
 # stage 2: fetch + cache
 # --------------------------------------------------------------------------
+# The Energy-Charts endpoints read start/end dates as local days in the
+# bidding zone, so a DE-LU window for 2026-01-01 opens at 23:00 UTC the day
+# before (the committed cache starts at 2025-12-31 23:00+00:00).
+API_TZ = "Europe/Berlin"
+
+
+def _chunk_is_cached(existing: pd.DataFrame, lo: pd.Timestamp, hi: pd.Timestamp) -> bool:
+    """True when every hour the API returns for lo..hi is already cached, with no NaN.
+
+    Only a chunk with nothing left to fill is skipped. One missing or partial
+    hour sends the whole chunk back to the API, because the endpoints cannot
+    be asked for single hours. The hours are taken on API_TZ day boundaries,
+    not UTC ones, or the pre-midnight-UTC hours at the start of a chunk would
+    never be checked and, once missing, never be refetched. The API's `end`
+    date is inclusive (history_window in app/forecast_service.py relies on
+    it), so day `hi` is checked too; leaving it out let a run whose only new
+    hours were on the last day skip that day as "already cached".
+    """
+    if existing.empty or not isinstance(existing.index, pd.DatetimeIndex):
+        return False
+    hours = pd.date_range(
+        pd.Timestamp(lo).tz_localize(API_TZ),
+        (pd.Timestamp(hi) + pd.Timedelta(days=1)).tz_localize(API_TZ),
+        freq="h",
+        inclusive="left",
+    )
+    if hours.empty:
+        return False
+    if existing.index.tz is None:
+        hours = hours.tz_convert("UTC").tz_localize(None)
+    else:
+        hours = hours.tz_convert(existing.index.tz)
+    return bool(existing.reindex(hours).notna().all().all())
+
+
 def fetch_live(start: str, end: str, chunk_days: int = 30, cache: Path | None = None) -> None:
     """Fetch the live window in chunks and cache the result.
 
     The API read-times-out on multi-month ranges (each fetch_exog call fans
     out to four endpoints), so the window is walked in chunks and
-    concatenated. Chunks overlap by nothing and are de-duplicated on the
-    index, so a boundary hour cannot be counted twice.
+    concatenated. The API's end date is inclusive, so consecutive chunks
+    share their boundary day; they are de-duplicated on the index, so a
+    boundary hour cannot be counted twice.
 
     `cache` defaults to the module-level LIVE_CACHE. It exists so --cache can
     actually redirect the write: previously the flag was documented as an
@@ -164,6 +200,12 @@ def fetch_live(start: str, end: str, chunk_days: int = 30, cache: Path | None =
     `--fetch --cache other.csv` silently overwrote the committed,
     non-reproducible data/raw/live_ood_de.csv -- a flag meant to protect that
     file destroyed it instead.
+
+    Chunks the cache already covers completely are not requested again. A
+    re-run to fill holes used to re-download the whole window, and so it
+    hit 429s and dropped TLS connections on chunks it did not need. It also
+    replaced committed hours with whatever the API returned that day. To
+    re-pull a window from scratch, point --cache at a fresh file.
     """
     cache = LIVE_CACHE if cache is None else Path(cache)
 
@@ -184,9 +226,14 @@ def fetch_live(start: str, end: str, chunk_days: int = 30, cache: Path | None =
     if pd.Timestamp(end) not in bounds:
         bounds.append(pd.Timestamp(end))
 
+    existing = pd.read_csv(cache, index_col=0, parse_dates=True) if cache.exists() else None
+
     print(f"fetching {cfg['live']['bzn']} {start} -> {end} in {len(bounds) - 1} chunks")
     parts = []
     for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if existing is not None and _chunk_is_cached(existing, lo, hi):
+            print(f"  {lo.date()} -> {hi.date()} (already cached, skipped)", flush=True)
+            continue
         print(f"  {lo.date()} -> {hi.date()}", flush=True)
         try:
             parts.append(loader.fetch_exog(start=str(lo.date()), end=str(hi.date())))
@@ -199,8 +246,7 @@ def fetch_live(start: str, end: str, chunk_days: int = 30, cache: Path | None =
     # fail independently (429s and transient TLS errors are routine here),
     # so a retry must be able to fill holes without discarding the chunks
     # that already succeeded.
-    if cache.exists():
-        existing = pd.read_csv(cache, index_col=0, parse_dates=True)
+    if existing is not None:
         print(f"merging into {len(existing)} already-cached rows")
         parts.append(existing)
 
@@ -278,20 +324,18 @@ def _metrics(frame: pd.DataFrame) -> dict:
 
 
 def _long(name: str, origins, y_true: pd.DataFrame, y_pred: pd.DataFrame) -> pd.DataFrame:
-    rows = []
-    for day in origins:
-        rows.append(
-            pd.DataFrame(
-                dict(
-                    origin=[day] * 24,
-                    hour=range(24),
-                    y_true=y_true.loc[day].to_numpy(),
-                    y_pred=y_pred.loc[day].to_numpy(),
-                    model=name,
-                )
-            )
+    # Built in one allocation rather than one 24-row frame per day plus a
+    # concat: rows come out origin-major, hour-minor, exactly as before.
+    origins = pd.DatetimeIndex(origins)
+    return pd.DataFrame(
+        dict(
+            origin=origins.repeat(24),
+            hour=list(range(24)) * len(origins),
+            y_true=y_true.loc[origins].to_numpy().ravel(),
+            y_pred=y_pred.loc[origins].to_numpy().ravel(),
+            model=name,
         )
-    return pd.concat(rows, ignore_index=True)
+    )
 
 
 def replay(cache: Path = LIVE_CACHE) -> None:
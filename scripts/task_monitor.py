@@ -9,8 +9,10 @@ on-disk footprints (works no matter which shell/session launched them):
     (finished-trial count vs configs/evaluation.yaml optuna.n_trials)
 
 For each activity: state (RUNNING / STALLED / DONE), progress, rate,
-time spent, and ETA. Rate comes from the artifact's own ctime->mtime
-span, so it is accurate even across pauses/resumes of the same file.
+time spent, and ETA. Rate comes from the artifact's own creation->mtime
+span where the platform reports a creation time (macOS/BSD, Windows); on
+Linux the span starts at st_ctime, which appends move, so rate and ETA
+there are unreliable.
 
 Usage:
     python scripts/task_monitor.py            # one-shot status table
@@ -23,7 +25,7 @@ from __future__ import annotations
 import sqlite3
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -54,7 +56,24 @@ def expected_origins_from_config() -> int:
     return years_test * days_per_year
 
 
+def n_trials_from_config() -> int:
+    """Optuna trial target every tuning activity's progress is measured against.
+
+    Read once at import, like EXPECTED_ORIGINS, rather than re-parsed from
+    configs/evaluation.yaml on every refresh: the target must not move under
+    a running study (PROCEED_RULES lists editing that file mid-search as
+    something to avoid), so a mid-watch re-read could only ever mislead.
+    Falls back to the project's fixed 50 trials if the config is absent.
+    """
+    eval_cfg = REPO_ROOT / "configs" / "evaluation.yaml"
+    if not eval_cfg.exists():
+        return 50
+    with open(eval_cfg) as f:
+        return int(yaml.safe_load(f)["optuna"]["n_trials"])
+
+
 EXPECTED_ORIGINS = expected_origins_from_config()
+N_TRIALS_TARGET = n_trials_from_config()
 STALL_SECONDS = 300  # no file write for 5 min while incomplete = stalled
 
 
@@ -65,12 +84,17 @@ class Activity:
     total: int
     started: float  # epoch
     last_write: float  # epoch
+    # Clock reading for the refresh that produced this row. state, eta_s and
+    # the "finishes" column all judge against this one instant; reading the
+    # clock per access let a row near the stall boundary render as RUNNING
+    # with an ETA in one column and STALLED in the next.
+    observed: float = field(default_factory=time.time)  # epoch
 
     @property
     def state(self) -> str:
         if self.done >= self.total:
             return "DONE"
-        if time.time() - self.last_write > STALL_SECONDS:
+        if self.observed - self.last_write > STALL_SECONDS:
             return "STALLED"
         return "RUNNING"
 
@@ -96,16 +120,61 @@ def _fmt_dur(seconds: float | None) -> str:
     return f"{h}h{m:02d}m" if h else (f"{m}m{s:02d}s" if m else f"{s}s")
 
 
+# path -> (bytes already counted, newlines in them, last bytes before that
+# offset). Lets --watch read only what a run appended since the last refresh.
+_NEWLINE_CACHE: dict[Path, tuple[int, int, bytes]] = {}
+_TAIL_BYTES = 64
+
+
+def _count_newlines(path: Path) -> int:
+    """Newline count of `path`, scanning only bytes appended since last call.
+
+    Append-only growth is the normal case, but not the only one:
+    run_full_baselines' repair_partial_origins rewrites a CSV in place on
+    resume. Such a rewrite, or a truncation, is detected by re-reading the
+    bytes just before the cached offset; on any mismatch the file is
+    recounted from the start.
+    """
+    offset, lines, tail = _NEWLINE_CACHE.get(path, (0, 0, b""))
+    with open(path, "rb") as f:
+        if offset:
+            f.seek(offset - len(tail))
+            if f.read(len(tail)) != tail:
+                f.seek(0)
+                offset, lines, tail = 0, 0, b""
+        # 1 MiB blocks rather than line iteration: no bytes object per row
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+            offset += len(block)
+            tail = (tail + block[-_TAIL_BYTES:])[-_TAIL_BYTES:]
+    _NEWLINE_CACHE[path] = (offset, lines, tail)
+    return lines
+
+
 def _count_csv_origins(path: Path) -> int:
     # 24 rows per completed origin (+1 header); a partially written origin
-    # rounds down, matching the resume logic in run_full_baselines.py
-    with open(path, "rb") as f:
-        lines = sum(1 for _ in f)
-    return max(0, (lines - 1) // 24)
+    # rounds down. A final row with no newline is a torn write, so it is not
+    # counted -- run_full_baselines.completed_origins() distrusts it too.
+    return max(0, (_count_newlines(path) - 1) // 24)
+
+
+def _created_at(stat) -> float:
+    """Creation time of a file, for the start of an activity's rate span.
+
+    st_ctime is creation time only on Windows, and Python 3.12 deprecates
+    it for that meaning in favour of st_birthtime. On POSIX st_ctime is the
+    last metadata change, which every append bumps, so the span collapses to
+    ~0 and the monitor reports a near-zero rate and an ETA of "0s" for a
+    run with hours left. st_birthtime fixes that on macOS/BSD and on
+    Windows. Linux os.stat has no st_birthtime, so there this still falls
+    back to st_ctime and the rate and ETA remain unreliable.
+    """
+    return getattr(stat, "st_birthtime", stat.st_ctime)
 
 
 def discover() -> list[Activity]:
     activities = []
+    now = time.time()  # one clock reading per refresh, shared by every row
 
     for csv in sorted(BASELINES_DIR.glob("*.csv")) if BASELINES_DIR.exists() else []:
         stat = csv.stat()
@@ -114,17 +183,12 @@ def discover() -> list[Activity]:
                 name=f"walk-forward: {csv.stem}",
                 done=_count_csv_origins(csv),
                 total=EXPECTED_ORIGINS,
-                started=stat.st_ctime,
+                started=_created_at(stat),
                 last_write=stat.st_mtime,
+                observed=now,
             )
         )
 
-    n_trials_target = 50
-    eval_cfg = REPO_ROOT / "configs" / "evaluation.yaml"
-    if eval_cfg.exists():
-        with open(eval_cfg) as f:
-            n_trials_target = yaml.safe_load(f)["optuna"]["n_trials"]
-
     for db in sorted(TUNING_DIR.glob("*_study.db")) if TUNING_DIR.exists() else []:
         try:
             con = sqlite3.connect(f"file:{db.as_posix()}?mode=ro", uri=True)
@@ -139,9 +203,10 @@ def discover() -> list[Activity]:
             Activity(
                 name=f"tuning: {db.stem.replace('_study', '')}",
                 done=finished,
-                total=n_trials_target,
-                started=stat.st_ctime,
+                total=N_TRIALS_TARGET,
+                started=_created_at(stat),
                 last_write=stat.st_mtime,
+                observed=now,
             )
         )
 
@@ -193,7 +258,8 @@ PROCEED_RULES = {
 
 
 def render(activities: list[Activity]) -> str:
-    now = datetime.now().strftime("%H:%M:%S")
+    observed = activities[0].observed if activities else time.time()
+    now = datetime.fromtimestamp(observed).strftime("%H:%M:%S")
     header = (
         f"task monitor @ {now}\n"
         f"{'activity':<28} {'state':<8} {'progress':<28} "
@@ -207,7 +273,7 @@ def render(activities: list[Activity]) -> str:
         spent = _fmt_dur(a.last_write - a.started)
         eta = _fmt_dur(a.eta_s)
         finishes = (
-            datetime.fromtimestamp(time.time() + a.eta_s).strftime("%H:%M")
+            datetime.fromtimestamp(a.observed + a.eta_s).strftime("%H:%M")
             if a.eta_s
             else "-"
         )
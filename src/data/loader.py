@@ -133,7 +133,25 @@ class EnergyChartsLoader:
                 time.sleep(wait)
                 continue
             r.raise_for_status()
-            return r.json()
+            try:
+                return r.json()
+            except ValueError as exc:
+                # A 200 is not proof of data: under load the host has been
+                # seen answering with an empty body or an HTML error page.
+                # Bare r.json() surfaced that as a JSONDecodeError with no
+                # URL in it, so treat it like any other transient failure
+                # and, once retries run out, say what actually came back.
+                if attempt >= self._MAX_RETRIES:
+                    raise ValueError(
+                        f"{url} returned a non-JSON body (HTTP {r.status_code}, "
+                        f"Content-Type {r.headers.get('Content-Type')!r}): "
+                        f"{r.text[:200]!r}"
+                    ) from exc
+                wait = 2.0 ** attempt
+                logger.warning(
+                    "non-JSON body from %s, retrying in %.1fs", url, wait
+                )
+                time.sleep(wait)
 
     @staticmethod
     def _observations_per_hour(index: pd.DatetimeIndex) -> int:
@@ -46,7 +46,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-from src.models.base import HOURS, Y_COLUMNS, BaseModel
+from src.models.base import Y_COLUMNS, BaseModel
 from src.evaluation.walk_forward import load_evaluation_config
 
 DOW_COLUMNS = [f"dow_{i}" for i in range(7)]
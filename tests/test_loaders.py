@@ -4,6 +4,7 @@ Offline tests always run; network-dependent tests are marked and can be
 skipped with:  pytest -m "not network"
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -81,6 +82,49 @@ def test_energycharts_renewables_missing_component_is_nan(monkeypatch):
     assert pd.isna(df["renewables"].iloc[0])
 
 
+class _FakeResponse:
+    def __init__(self, body: str, content_type: str = "application/json"):
+        self.status_code = 200
+        self.headers = {"Content-Type": content_type}
+        self.text = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def test_energycharts_get_retries_a_non_json_body(monkeypatch):
+    """An HTML error page served with HTTP 200 is a transient failure, not
+    data: it must go through the same backoff as a dropped connection."""
+    import src.data.loader as loader_module
+
+    bodies = iter(
+        [
+            _FakeResponse("<html>Service busy</html>", "text/html"),
+            _FakeResponse('{"unix_seconds": [0], "price": [1.0]}'),
+        ]
+    )
+    monkeypatch.setattr(loader_module.requests, "get", lambda *a, **k: next(bodies))
+    monkeypatch.setattr(loader_module.time, "sleep", lambda s: None)
+
+    data = EnergyChartsLoader(load_config())._get("price", {})
+    assert data == {"unix_seconds": [0], "price": [1.0]}
+
+
+def test_energycharts_get_names_the_url_when_the_body_never_parses(monkeypatch):
+    import src.data.loader as loader_module
+
+    monkeypatch.setattr(
+        loader_module.requests, "get", lambda *a, **k: _FakeResponse("", "text/html")
+    )
+    monkeypatch.setattr(loader_module.time, "sleep", lambda s: None)
+
+    with pytest.raises(ValueError, match="price.*non-JSON body.*text/html"):
+        EnergyChartsLoader(load_config())._get("price", {})
+
+
 @pytest.mark.network
 def test_energycharts_fetch_week():
     cfg = load_config()
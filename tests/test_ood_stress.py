@@ -26,8 +26,8 @@ ood = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(ood)
 
 
-def _write_cache(path: Path, start: str, days: int = 30) -> Path:
-    idx = pd.date_range(start, periods=days * 24, freq="h", tz="UTC")
+def _write_cache(path: Path, start: str, days: int = 30, tz: str = "UTC") -> Path:
+    idx = pd.date_range(start, periods=days * 24, freq="h", tz=tz).tz_convert("UTC")
     pd.DataFrame(
         {"price": 50.0, "exog_1": 40000.0, "exog_2": 15000.0}, index=idx
     ).rename_axis("timestamp").to_csv(path)
@@ -129,3 +129,125 @@ def test_fetch_live_hits_the_api(tmp_path, monkeypatch):
     df = pd.read_csv(tmp_path / "live.csv", index_col=0, parse_dates=True)
     assert {"price", "exog_1", "exog_2"} <= set(df.columns)
     assert len(df) > 0
+
+
+class _RecordingLoader:
+    """Stands in for EnergyChartsLoader, which fetch_live builds locally."""
+
+    attribution = "test fixture"
+    calls: list[tuple[str, str]] = []
+
+    def __init__(self, *a, **k):
+        pass
+
+    def fetch_exog(self, start: str, end: str) -> pd.DataFrame:
+        type(self).calls.append((start, end))
+        # Local API days through `end` inclusive, stored in UTC -- what the
+        # real endpoints return.
+        idx = pd.date_range(
+            start,
+            pd.Timestamp(end) + pd.Timedelta(days=1),
+            freq="h",
+            inclusive="left",
+            tz=ood.API_TZ,
+        ).tz_convert("UTC")
+        return pd.DataFrame(
+            {"price": 60.0, "exog_1": 40000.0, "exog_2": 15000.0}, index=idx
+        ).rename_axis("timestamp")
+
+
+def test_fetch_live_skips_chunks_the_cache_already_covers(tmp_path, monkeypatch):
+    """Filling a hole used to re-download every chunk of the window. Each
+    extra request is another chance at a 429 or a dropped TLS handshake,
+    and the fresh rows overwrote committed ones. A fully cached chunk must
+    not be requested again."""
+    cache = _write_cache(tmp_path / "live.csv", "2026-01-01", days=31, tz=ood.API_TZ)
+    monkeypatch.setattr(_RecordingLoader, "calls", [])
+    monkeypatch.setattr(ood, "EnergyChartsLoader", _RecordingLoader)
+
+    ood.fetch_live("2026-01-01", "2026-03-02", chunk_days=30, cache=cache)
+
+    assert _RecordingLoader.calls == [("2026-01-31", "2026-03-02")]
+    df = pd.read_csv(cache, index_col=0, parse_dates=True)
+    split = pd.Timestamp("2026-01-31", tz=ood.API_TZ)
+    assert (df.loc[df.index < split, "price"] == 50.0).all(), "cached hours were replaced"
+    assert (df.loc[df.index >= split, "price"] == 60.0).all()
+
+
+def test_fetch_live_fetches_the_inclusive_end_day(tmp_path, monkeypatch):
+    """The API's end date is inclusive, so the last chunk returns day `end`
+    itself. Checking only up to `end` exclusive skipped a chunk whose sole
+    new day was `end`: a daily --fetch never added today."""
+    cache = _write_cache(tmp_path / "live.csv", "2026-01-01", days=31, tz=ood.API_TZ)
+    monkeypatch.setattr(_RecordingLoader, "calls", [])
+    monkeypatch.setattr(ood, "EnergyChartsLoader", _RecordingLoader)
+
+    ood.fetch_live("2026-01-01", "2026-02-01", chunk_days=30, cache=cache)
+
+    assert _RecordingLoader.calls == [("2026-01-31", "2026-02-01")]
+    df = pd.read_csv(cache, index_col=0, parse_dates=True)
+    assert df.index.max() == pd.Timestamp("2026-02-01 23:00", tz=ood.API_TZ)
+
+
+def test_fetch_live_refetches_a_chunk_missing_only_its_pre_midnight_utc_hour(
+    tmp_path, monkeypatch
+):
+    """The API's 2026-01-01 opens at 23:00 UTC on 2025-12-31. A UTC-day check
+    never looked at that hour, so a chunk missing only it was skipped and the
+    hole could never be filled."""
+    cache = _write_cache(tmp_path / "live.csv", "2026-01-01", days=31, tz=ood.API_TZ)
+    df = pd.read_csv(cache, index_col=0, parse_dates=True)
+    df.iloc[1:].to_csv(cache)
+    monkeypatch.setattr(_RecordingLoader, "calls", [])
+    monkeypatch.setattr(ood, "EnergyChartsLoader", _RecordingLoader)
+
+    ood.fetch_live("2026-01-01", "2026-01-31", chunk_days=30, cache=cache)
+
+    assert _RecordingLoader.calls == [("2026-01-01", "2026-01-31")]
+
+
+def test_chunk_check_treats_an_empty_cache_as_uncached(tmp_path):
+    cache = tmp_path / "live.csv"
+    cache.write_text("timestamp,price,exog_1,exog_2\n")
+    existing = pd.read_csv(cache, index_col=0, parse_dates=True)
+
+    assert not ood._chunk_is_cached(
+        existing, pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-31")
+    )
+
+
+def test_fetch_live_refetches_a_chunk_with_a_gap(tmp_path, monkeypatch):
+    """A single NaN hour means the chunk still has something to fill."""
+    cache = _write_cache(tmp_path / "live.csv", "2026-01-01", days=31, tz=ood.API_TZ)
+    df = pd.read_csv(cache, index_col=0, parse_dates=True)
+    df.iloc[100, 0] = float("nan")
+    df.to_csv(cache)
+    monkeypatch.setattr(_RecordingLoader, "calls", [])
+    monkeypatch.setattr(ood, "EnergyChartsLoader", _RecordingLoader)
+
+    ood.fetch_live("2026-01-01", "2026-01-31", chunk_days=30, cache=cache)
+
+    assert _RecordingLoader.calls == [("2026-01-01", "2026-01-31")]
+
+
+def test_long_frame_is_origin_major_and_matches_the_wide_frames():
+    """_long feeds the scored OOD CSVs: each origin's 24 rows must carry that
+    origin's own hour-h truth and prediction, in hour order."""
+    days = pd.date_range("2026-01-08", periods=3, freq="D", tz="UTC")
+    cols = [f"h{h:02d}" for h in range(24)]
+    y_true = pd.DataFrame(
+        [[100 * d + h for h in range(24)] for d in range(3)],
+        index=days,
+        columns=cols,
+        dtype=float,
+    )
+    y_pred = y_true + 0.5
+
+    out = ood._long("LightGBM", days, y_true, y_pred)
+
+    assert list(out.columns) == ["origin", "hour", "y_true", "y_pred", "model"]
+    assert len(out) == 72
+    assert (out.groupby("origin").size() == 24).all()
+    row = out[(out["origin"] == days[2]) & (out["hour"] == 17)].iloc[0]
+    assert row["y_true"] == 217.0 and row["y_pred"] == 217.5
+    assert (out["model"] == "LightGBM").all()
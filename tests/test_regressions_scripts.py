@@ -215,6 +215,23 @@ def test_resume_removes_partial_origin_rows_instead_of_duplicating_them(tmp_path
     assert counts.loc["2016-01-04"] == 24
 
 
+def test_resume_does_not_trust_a_row_cut_off_before_its_newline(tmp_path):
+    """pd.read_csv parses an unterminated final row, so a crash while writing
+    hour 23 used to complete the origin with a truncated y_pred ("1.") and
+    leave the next append glued onto the same line.
+    """
+    out = tmp_path / "naive.csv"
+    header = "origin,hour,y_true,y_pred,model\n"
+    full = "".join(f"2016-01-04,{h},1.0,1.0,naive\n" for h in range(24))
+    torn = "".join(f"2016-01-05,{h},1.0,1.0,naive\n" for h in range(23)) + "2016-01-05,23,1."
+    out.write_text(header + full + torn)
+
+    assert run_full_baselines.completed_origins(out) == {pd.Timestamp("2016-01-04")}
+
+    assert run_full_baselines.repair_partial_origins(out) == 24
+    assert out.read_text() == header + full
+
+
 # ==========================================================================
 # scripts/week5_checkpoint.py
 # ==========================================================================
@@ -0,0 +1,156 @@
+"""Tests for scripts/task_monitor.py — the background-run monitor.
+
+The monitor only reads artifacts (CSV row counts, study DB trial counts,
+file timestamps), so everything here runs against files in tmp_path. The
+resume/pause regressions live in tests/test_regressions_scripts.py; this
+module covers how progress and state are derived from those artifacts.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _load_script(name: str):
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / "scripts" / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    # Register before exec: @dataclass resolves annotations via
+    # sys.modules[cls.__module__], which is None for an unregistered module.
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+task_monitor = _load_script("task_monitor")
+
+
+def test_state_and_eta_are_judged_against_one_clock_reading(monkeypatch):
+    """state, eta_s and the "finishes" column used to read the clock on every
+    access. A row sitting on the stall boundary could then render RUNNING
+    with an ETA in one column and STALLED in the next, within one refresh.
+    The row's verdict must depend only on the refresh that produced it.
+    """
+    observed = 1_000_000.0
+    activity = task_monitor.Activity(
+        name="walk-forward: naive",
+        done=100,
+        total=728,
+        started=observed - 3600,
+        last_write=observed - task_monitor.STALL_SECONDS,
+        observed=observed,
+    )
+    assert activity.state == "RUNNING"
+    eta = activity.eta_s
+
+    # The wall clock moves past the stall boundary mid-render.
+    monkeypatch.setattr(time, "time", lambda: observed + 60)
+
+    assert activity.state == "RUNNING"
+    assert activity.eta_s == eta
+    row = next(
+        line for line in task_monitor.render([activity]).splitlines()
+        if line.startswith(activity.name)
+    )
+    assert "RUNNING" in row
+
+
+def test_discover_stamps_every_row_with_the_same_observation(tmp_path, monkeypatch):
+    baselines = tmp_path / "baselines"
+    baselines.mkdir()
+    header = "origin,hour,y_true,y_pred,model\n"
+    for stem in ("naive", "lstm"):
+        (baselines / f"{stem}.csv").write_text(header + "2016-01-04,0,1,1,x\n" * 24)
+    monkeypatch.setattr(task_monitor, "BASELINES_DIR", baselines)
+    monkeypatch.setattr(task_monitor, "TUNING_DIR", tmp_path / "tuning")
+
+    activities = task_monitor.discover()
+
+    assert len(activities) == 2
+    assert len({a.observed for a in activities}) == 1
+
+
+def test_origin_count_rounds_a_torn_origin_down(tmp_path):
+    """24 rows per origin plus a header. A crash mid-origin leaves a partial
+    block (possibly ending mid-row), which must not count as complete --
+    the same rule run_full_baselines.completed_origins() resumes by."""
+    header = "origin,hour,y_true,y_pred,model\n"
+    full = "".join(f"2016-01-04,{h},1.0,1.0,naive\n" for h in range(24))
+    torn = "".join(f"2016-01-05,{h},1.0,1.0,naive\n" for h in range(23)) + "2016-01-05,23,1."
+
+    path = tmp_path / "naive.csv"
+    path.write_text(header + full + torn)
+    assert task_monitor._count_csv_origins(path) == 1
+
+    path.write_text(header)
+    assert task_monitor._count_csv_origins(path) == 0
+
+
+def _rows(origin: str, hours, value: str = "1.0") -> str:
+    return "".join(f"{origin},{h},{value},{value},naive\n" for h in hours)
+
+
+def test_origin_count_follows_appends_and_in_place_rewrites(tmp_path, monkeypatch):
+    """--watch only scans what was appended since the previous refresh, so the
+    cached offset must be abandoned when the file is rewritten rather than
+    grown -- repair_partial_origins does exactly that on every resume."""
+    monkeypatch.setattr(task_monitor, "_NEWLINE_CACHE", {})
+    header = "origin,hour,y_true,y_pred,model\n"
+    path = tmp_path / "naive.csv"
+
+    path.write_text(header + _rows("2016-01-04", range(24)) + _rows("2016-01-05", range(10)))
+    assert task_monitor._count_csv_origins(path) == 1
+
+    with open(path, "a") as f:  # the run finishes the torn origin
+        f.write(_rows("2016-01-05", range(10, 24)))
+    assert task_monitor._count_csv_origins(path) == 2
+
+    # Rewritten in place, longer than before but with fewer rows: resuming
+    # the count from the old offset would read mid-row and report 2.
+    path.write_text(header + _rows("2016-01-04", range(24), value="41.123456789012345"))
+    assert task_monitor._count_csv_origins(path) == 1
+
+    path.write_text(header)  # truncated
+    assert task_monitor._count_csv_origins(path) == 0
+
+
+def test_rate_span_starts_at_creation_not_last_metadata_change():
+    """On POSIX st_ctime moves with every append, so a ctime->mtime span is
+    ~0 and the rate and ETA read as "instant". Creation time must win
+    wherever the platform reports it (not Linux, which keeps st_ctime)."""
+    from types import SimpleNamespace
+
+    created, appended = 1_000.0, 9_000.0
+    macos_bsd = SimpleNamespace(
+        st_birthtime=created, st_ctime=appended, st_mtime=appended
+    )
+    assert task_monitor._created_at(macos_bsd) == created
+
+    windows_pre_312 = SimpleNamespace(st_ctime=created, st_mtime=appended)
+    assert task_monitor._created_at(windows_pre_312) == created
+
+
+def test_tuning_progress_uses_the_trial_target_read_at_import(tmp_path, monkeypatch):
+    import sqlite3
+
+    assert task_monitor.N_TRIALS_TARGET == task_monitor.n_trials_from_config()
+
+    tuning = tmp_path / "tuning"
+    tuning.mkdir()
+    con = sqlite3.connect(tuning / "lightgbm_study.db")
+    con.execute("CREATE TABLE trials (state TEXT)")
+    con.executemany("INSERT INTO trials VALUES (?)", [("COMPLETE",)] * 3 + [("RUNNING",)])
+    con.commit()
+    con.close()
+    monkeypatch.setattr(task_monitor, "BASELINES_DIR", tmp_path / "baselines")
+    monkeypatch.setattr(task_monitor, "TUNING_DIR", tuning)
+    monkeypatch.setattr(task_monitor, "N_TRIALS_TARGET", 7)
+
+    (activity,) = task_monitor.discover()
+
+    assert (activity.name, activity.done, activity.total) == ("tuning: lightgbm", 3, 7)